@@ -0,0 +1,44 @@
+"""
+Django settings used to run the test suite.
+
+manage.py selects this module for the test command, so run the tests with:
+
+    python manage.py test --parallel=auto
+"""
+
+from BackEnd_Challenge.settings import *  # noqa: F401,F403
+
+
+# Database
+# The test database lives in memory, so no INSERT/SELECT touches the disk.
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+
+# Migrations
+# Build the test schema straight from the models (one CREATE TABLE per model)
+# instead of replaying the whole migration history.
+
+class DisableMigrations:
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = DisableMigrations()
+
+
+# Password hashing
+# The tests never need a strong hash; MD5 keeps creating or logging in users cheap.
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
@@ -1,4 +1,14 @@
 from django.contrib import admin
 from bank_API.models import Account
 # Register your models here.
-admin.site.register(Account)
+
+
+@admin.register(Account)
+class AccountAdmin(admin.ModelAdmin):
+
+    def save_model(self, request, obj, form, change):
+        # Only write the columns that were edited instead of the whole row.
+        if change and form.changed_data:
+            obj.save(update_fields=[*form.changed_data, 'last_update'])
+        else:
+            super().save_model(request, obj, form, change)
@@ -0,0 +1,23 @@
+# Generated by Django 4.1.7 on 2026-10-15 08:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bank_API', '0012_alter_transaction_timestamp'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='account',
+            name='balance',
+            field=models.DecimalField(decimal_places=2, max_digits=18),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='amount',
+            field=models.DecimalField(decimal_places=2, max_digits=18),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.1.7 on 2026-10-15 08:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bank_API', '0013_alter_account_balance_alter_transaction_amount'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='account',
+            constraint=models.CheckConstraint(check=models.Q(('balance__gte', 0)), name='acct_balance_nonneg'),
+        ),
+        migrations.AddConstraint(
+            model_name='transaction',
+            constraint=models.CheckConstraint(check=models.Q(('amount__gte', 0)), name='tx_amount_nonneg'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.1.7 on 2026-10-15 08:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bank_API', '0014_account_acct_balance_nonneg_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['account_number', '-timestamp'], name='tx_acct_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['status'], name='tx_status_idx'),
+        ),
+    ]
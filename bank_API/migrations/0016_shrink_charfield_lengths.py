@@ -0,0 +1,43 @@
+# Generated by Django 4.1.7 on 2026-10-15 08:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bank_API', '0015_transaction_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='account',
+            name='account_number',
+            field=models.CharField(max_length=32, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='account',
+            name='account_type',
+            field=models.CharField(choices=[('Savings', 'Savings'), ('Checking', 'Checking')], max_length=8),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='description',
+            field=models.CharField(max_length=140),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='status',
+            field=models.CharField(max_length=16),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='transaction_id',
+            field=models.CharField(max_length=40, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='transaction_type',
+            field=models.CharField(choices=[('Deposit', 'Deposit'), ('Withdraw', 'Withdraw')], max_length=8),
+        ),
+    ]
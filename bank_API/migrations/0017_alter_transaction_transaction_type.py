@@ -0,0 +1,40 @@
+# Generated by Django 4.1.7 on 2026-10-15 08:40
+
+from django.db import migrations, models
+
+
+TRANSACTION_TYPE_CODES = {
+    'deposit': '1',
+    'withdraw': '2',
+}
+
+
+def transaction_type_to_code(apps, schema_editor):
+    Transaction = apps.get_model('bank_API', 'Transaction')
+    for label, code in TRANSACTION_TYPE_CODES.items():
+        Transaction.objects.filter(
+            transaction_type__iexact=label).update(transaction_type=code)
+
+
+def transaction_type_to_label(apps, schema_editor):
+    Transaction = apps.get_model('bank_API', 'Transaction')
+    for label, code in TRANSACTION_TYPE_CODES.items():
+        Transaction.objects.filter(
+            transaction_type=code).update(transaction_type=label.capitalize())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bank_API', '0016_shrink_charfield_lengths'),
+    ]
+
+    operations = [
+        migrations.RunPython(transaction_type_to_code,
+                             transaction_type_to_label),
+        migrations.AlterField(
+            model_name='transaction',
+            name='transaction_type',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Deposit'), (2, 'Withdraw')]),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.1.7 on 2026-10-15 08:42
+
+from django.db import migrations, models
+
+
+ACCOUNT_TYPE_CODES = {
+    'savings': 'S',
+    'checking': 'C',
+}
+
+
+def account_type_to_code(apps, schema_editor):
+    Account = apps.get_model('bank_API', 'Account')
+    for label, code in ACCOUNT_TYPE_CODES.items():
+        Account.objects.filter(
+            account_type__iexact=label).update(account_type=code)
+
+
+def account_type_to_label(apps, schema_editor):
+    Account = apps.get_model('bank_API', 'Account')
+    for label, code in ACCOUNT_TYPE_CODES.items():
+        Account.objects.filter(
+            account_type=code).update(account_type=label.capitalize())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bank_API', '0017_alter_transaction_transaction_type'),
+    ]
+
+    operations = [
+        migrations.RunPython(account_type_to_code, account_type_to_label),
+        migrations.AlterField(
+            model_name='account',
+            name='account_type',
+            field=models.CharField(choices=[('S', 'Savings'), ('C', 'Checking')], max_length=1),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.1.7 on 2026-10-15 08:42
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bank_API', '0018_alter_account_account_type'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='account',
+            name='balance',
+            field=models.DecimalField(decimal_places=2, max_digits=18, validators=[django.core.validators.MinValueValidator(0)]),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.1.7 on 2026-10-15 08:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bank_API', '0019_alter_account_balance'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(condition=models.Q(('status', 'Pending')), fields=['account_number'], name='tx_pending_idx'),
+        ),
+    ]
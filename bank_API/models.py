@@ -1,70 +1,235 @@
-from django.db import models
+# Django
+from django.core.validators import MinValueValidator
+from django.db import connection, models
+from django.db import transaction as db_transaction
+from django.db.models import F
+from django.db.models.functions import Now
 from django.forms import ValidationError
 
+# Python
+from collections import defaultdict
+from decimal import Decimal
+
 # Create your models here.
 
 
 class Account(models.Model):
-    SAVINGS = 'Savings'
-    CHECKING = 'Checking'
-    ACCOUNT_TYPE_CHOICES = [
-        (SAVINGS, 'Savings'),
-        (CHECKING, 'Checking'),
-    ]
-    account_number = models.CharField(max_length=200, unique=True)
-    balance = models.FloatField()
+    class AccountType(models.TextChoices):
+        SAVINGS = 'S', 'Savings'
+        CHECKING = 'C', 'Checking'
+
+    SAVINGS = AccountType.SAVINGS
+    CHECKING = AccountType.CHECKING
+    ACCOUNT_TYPE_CHOICES = AccountType.choices
+    account_number = models.CharField(max_length=32, unique=True)
+    balance = models.DecimalField(
+        max_digits=18, decimal_places=2, validators=[MinValueValidator(0)])
     customer_name = models.CharField(max_length=200)
     account_type = models.CharField(
-        max_length=200, choices=ACCOUNT_TYPE_CHOICES)
+        max_length=1, choices=ACCOUNT_TYPE_CHOICES)
     account_creation = models.DateTimeField(auto_now_add=True)
     last_update = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(balance__gte=0), name='acct_balance_nonneg'),
+        ]
+
     def __str__(self):
         return self.account_number
 
-    def clean(self):
-        super().clean()
-        if self.pk is None and self.balance <= 0:
-            raise ValidationError(
-                "Balance must be greater than 0 for new accounts")
+    def validate_constraints(self, exclude=None):
+        # acct_balance_nonneg repeats the MinValueValidator(0) of balance, which
+        # full_clean() already ran; checking it again would cost a SELECT per form.
+        # Skipping it is only safe while that validator stays on the field: without
+        # it a negative balance would pass validation and fail as an IntegrityError.
+        # The database still enforces the constraint on every write.
+        exclude = {*(exclude or ()), 'balance'}
+        super().validate_constraints(exclude=exclude)
 
-    def save(self, *args, **kwargs):
-        if self.balance < 0:
-            raise ValidationError("Balance can not be negative")
+    def update_balance(self, transaction):
+        sign = Transaction.BALANCE_SIGN.get(transaction.transaction_type)
+        if sign is None:
+            return
+        Account.objects.filter(pk=self.pk).update(
+            balance=F('balance') + sign * transaction.amount,
+            last_update=Now())
+        self.refresh_from_db(fields=['balance', 'last_update'])
 
-        super().save(*args, **kwargs)
+    @classmethod
+    def apply_deltas(cls, deltas):
+        """
+        Adds each amount of deltas ({account pk: Decimal}) to the balance of the
+        matching account. The pairs are loaded into a temporary table and applied
+        with one set-based UPDATE ... FROM (UPDATE ... JOIN on MySQL), so the cost
+        does not grow with one UPDATE statement per account.
+        """
+        if not deltas:
+            return
+        quote_name = connection.ops.quote_name
+        account_table = quote_name(cls._meta.db_table)
+        balance = quote_name(cls._meta.get_field('balance').column)
+        last_update = quote_name(cls._meta.get_field('last_update').column)
+        pk = quote_name(cls._meta.pk.column)
+        # Qualify the temporary table with the session's temporary schema so
+        # the DROP statements can never reach a permanent table of that name.
+        temp_table = {
+            'postgresql': 'pg_temp.tmp_balance_delta',
+            'sqlite': 'temp.tmp_balance_delta',
+        }.get(connection.vendor, 'tmp_balance_delta')
+        temporary = 'TEMPORARY ' if connection.vendor == 'mysql' else ''
+        # Stamp last_update with the database clock, like update_balance().
+        compiler = cls.objects.none().query.get_compiler(connection=connection)
+        now, now_params = compiler.compile(Now())
 
-    def update_balance(self, transaction):
-        if transaction.transaction_type == 'Deposit':
-            self.balance += transaction.amount
-        elif transaction.transaction_type == 'Withdraw':
-            self.balance -= transaction.amount
-        self.save()
+        with db_transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f'DROP {temporary}TABLE IF EXISTS {temp_table}')
+            cursor.execute(
+                f'CREATE TEMPORARY TABLE {temp_table} ('
+                'account_id bigint PRIMARY KEY, delta decimal(18, 2) NOT NULL)')
+            cursor.executemany(
+                f'INSERT INTO {temp_table} (account_id, delta) VALUES (%s, %s)',
+                list(deltas.items()))
+            if connection.vendor == 'mysql':
+                cursor.execute(
+                    f'UPDATE {account_table} JOIN {temp_table} AS delta '
+                    f'ON delta.account_id = {account_table}.{pk} '
+                    f'SET {account_table}.{balance} = {account_table}.{balance} + delta.delta, '
+                    f'{account_table}.{last_update} = {now}',
+                    now_params)
+            else:
+                cursor.execute(
+                    f'UPDATE {account_table} '
+                    f'SET {balance} = {account_table}.{balance} + delta.delta, '
+                    f'{last_update} = {now} '
+                    f'FROM {temp_table} AS delta '
+                    f'WHERE delta.account_id = {account_table}.{pk}',
+                    now_params)
+            cursor.execute(f'DROP {temporary}TABLE {temp_table}')
 
 
 class Transaction(models.Model):
-    DEPOSIT = 'Deposit'
-    WITHDRAW = 'Withdraw'
-    TRANSACTION_TYPE_CHOICES = [
-        (DEPOSIT, 'Deposit'),
-        (WITHDRAW, 'Withdraw'),
-    ]
-    transaction_id = models.CharField(max_length=200, unique=True)
+    class TransactionType(models.IntegerChoices):
+        DEPOSIT = 1, 'Deposit'
+        WITHDRAW = 2, 'Withdraw'
+
+    DEPOSIT = TransactionType.DEPOSIT
+    WITHDRAW = TransactionType.WITHDRAW
+    TRANSACTION_TYPE_CHOICES = TransactionType.choices
+    # Direction in which each transaction type moves the account balance.
+    BALANCE_SIGN = {
+        DEPOSIT: 1,
+        WITHDRAW: -1,
+    }
+    # Fields whose change moves the account balance.
+    BALANCE_FIELDS = {'account_number', 'amount', 'transaction_type'}
+    # Declaration order only: it sets the default field order of forms and the
+    # admin, not the column order of existing tables.
     account_number = models.ForeignKey(Account, on_delete=models.CASCADE)
-    amount = models.FloatField()
-    transaction_type = models.CharField(
-        max_length=200, choices=TRANSACTION_TYPE_CHOICES)
+    amount = models.DecimalField(max_digits=18, decimal_places=2)
+    transaction_type = models.PositiveSmallIntegerField(
+        choices=TRANSACTION_TYPE_CHOICES)
     timestamp = models.DateTimeField(auto_now_add=True)
-    description = models.CharField(max_length=200)
-    status = models.CharField(max_length=200)
+    status = models.CharField(max_length=16)
+    transaction_id = models.CharField(max_length=40, unique=True)
+    description = models.CharField(max_length=140)
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(amount__gte=0), name='tx_amount_nonneg'),
+        ]
+        indexes = [
+            models.Index(fields=['account_number', '-timestamp'],
+                         name='tx_acct_time_idx'),
+            models.Index(fields=['status'], name='tx_status_idx'),
+            models.Index(fields=['account_number'], name='tx_pending_idx',
+                         condition=models.Q(status='Pending')),
+        ]
 
     def __str__(self):
         return self.transaction_id
 
     def save(self, *args, **kwargs):
-        if self.amount < 0:
-            raise ValueError("Amount cannot be negative")
-        if self.transaction_type == 'Withdraw' and self.amount > self.account_number.balance:
-            raise ValidationError("Not enough funds in the account")
-        super().save(*args, **kwargs)
-        self.account_number.update_balance(self)
+        if not self._state.adding:
+            self._save_change(*args, **kwargs)
+            return
+        with db_transaction.atomic():
+            # Lock the account row so the funds check and the balance update
+            # can not interleave with a concurrent transaction. Only the
+            # balance is read; callers that already hold the account (e.g.
+            # through select_related('account_number')) keep their instance
+            # in sync, otherwise the locked row is reused and no further
+            # SELECT is issued for the related account.
+            account = Account.objects.select_for_update().only('balance').get(
+                pk=self.account_number_id)
+            if self.transaction_type == self.WITHDRAW and self.amount > account.balance:
+                raise ValidationError("Not enough funds in the account")
+            super().save(*args, **kwargs)
+            if self._meta.get_field('account_number').is_cached(self):
+                account = self.account_number
+            account.update_balance(self)
+
+    def _save_change(self, *args, **kwargs):
+        """
+        Saves an already stored transaction. The balance only moves when a field
+        that affects it is written, and then only by the difference between the
+        stored and the new effect, so an edit never applies the amount twice.
+        """
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and not self.BALANCE_FIELDS.intersection(update_fields):
+            super().save(*args, **kwargs)
+            return
+        sign_of = self.BALANCE_SIGN.get
+        with db_transaction.atomic():
+            stored = Transaction.objects.select_for_update().only(
+                'account_number', 'amount', 'transaction_type').get(pk=self.pk)
+            deltas = defaultdict(Decimal)
+            deltas[stored.account_number_id] -= sign_of(
+                stored.transaction_type, 0) * stored.amount
+            deltas[self.account_number_id] += sign_of(
+                self.transaction_type, 0) * self.amount
+            accounts = Account.objects.select_for_update().only(
+                'balance').in_bulk(list(deltas))
+            for pk, delta in deltas.items():
+                if accounts[pk].balance + delta < 0:
+                    raise ValidationError("Not enough funds in the account")
+            super().save(*args, **kwargs)
+            for pk, delta in deltas.items():
+                if delta:
+                    Account.objects.filter(pk=pk).update(
+                        balance=F('balance') + delta, last_update=Now())
+            if self._meta.get_field('account_number').is_cached(self):
+                self.account_number.refresh_from_db(
+                    fields=['balance', 'last_update'])
+
+    @classmethod
+    def bulk_apply(cls, transactions, batch_size=1000):
+        """
+        Inserts many transactions at once and applies their net effect to the
+        affected accounts with a single UPDATE, instead of the SELECT + INSERT +
+        UPDATE round-trips that save() issues for every transaction.
+
+        Only the resulting balance of each account is checked: if it would go
+        negative the acct_balance_nonneg constraint raises IntegrityError and
+        nothing of the batch is stored.
+        """
+        # The transactions are walked twice, so a generator is materialized first.
+        transactions = list(transactions)
+        amount_field = cls._meta.get_field('amount')
+        deltas = defaultdict(Decimal)
+        sign_of = cls.BALANCE_SIGN.get
+        for transaction in transactions:
+            # Normalize ints, floats and strings to the Decimal that is stored,
+            # so the balance moves by exactly the inserted amount.
+            transaction.amount = round(amount_field.to_python(
+                transaction.amount), amount_field.decimal_places)
+            deltas[transaction.account_number_id] += sign_of(
+                transaction.transaction_type, 0) * transaction.amount
+
+        with db_transaction.atomic():
+            created = cls.objects.bulk_create(
+                transactions, batch_size=batch_size)
+            Account.apply_deltas(deltas)
+        return created
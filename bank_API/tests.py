@@ -1,22 +1,51 @@
 # Django
 from django.forms import ValidationError
-from django.test import TestCase
-from django.db import IntegrityError
+from django.test import RequestFactory, TestCase
+from django.db import IntegrityError, connection
+from django.db.models import F
 from django.urls import reverse
 from django.utils import timezone
 
 # Python
 import json
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from unittest import mock
 
 # Local
 from .models import Account, Transaction
+from .views import AccountCreateView, AccountDeleteView, AccountUpdateView, TransactionCreateView
+
+
+# Every test runs with the clock stopped at this instant so timestamps are deterministic.
+FROZEN_TIME = timezone.make_aware(datetime(2024, 1, 1))
+frozen_clock = mock.patch('django.utils.timezone.now', return_value=FROZEN_TIME)
+
+
+def setUpModule():
+    frozen_clock.start()
+
+
+def tearDownModule():
+    frozen_clock.stop()
+
+
+@lru_cache(maxsize=None)
+def cached_reverse(viewname, *args):
+    """
+    Memoized reverse(). The URLconf does not change during a test run, so each (viewname, args)
+    pair only has to be resolved once.
+    """
+    return reverse(viewname, args=args)
 
 
 class AccountModelTest(TestCase):
 
-    def setUp(self):
-        self.account = Account.objects.create(account_number='1234567890', balance=500.00,
-                                              customer_name="Jhon Doe", account_type="Savings")
+    @classmethod
+    def setUpTestData(cls):
+        cls.account = Account.objects.create(account_number='1234567890', balance=Decimal('500.00'),
+                                             customer_name="Jhon Doe", account_type=Account.SAVINGS)
 
     def test_was_created_correctly(self):
         """
@@ -26,9 +55,10 @@ class AccountModelTest(TestCase):
         If any of the attribute checks fail, the test will fail.
         """
         self.assertEqual(self.account.account_number, '1234567890')
-        self.assertEqual(self.account.balance, 500.00)
+        self.assertEqual(self.account.balance, Decimal('500.00'))
         self.assertEqual(self.account.customer_name, "Jhon Doe")
-        self.assertEqual(self.account.account_type, "Savings")
+        self.assertEqual(self.account.account_type, Account.SAVINGS)
+        self.assertEqual(self.account.account_creation, FROZEN_TIME)
 
     def test_create_account_with_duplicated_account_number(self):
         """
@@ -40,26 +70,24 @@ class AccountModelTest(TestCase):
          the test if an error occurs. If no error is raised, the test fails with an AssertionError message
          indicating that the creation of an account with a duplicate account number was allowed.
         """
-        try:
-            Account.objects.create(account_number='1234567890', balance=5650.00,
-                                   customer_name='Superman', account_type='Cheks')
-        except IntegrityError:
-            pass
-        else:
-            raise AssertionError(
-                "Allowed to create an account with a duplicate account number")
+        with self.assertRaises(IntegrityError,
+                               msg="Allowed to create an account with a duplicate account number"):
+            Account.objects.create(account_number='1234567890', balance=Decimal('5650.00'),
+                                   customer_name='Superman', account_type=Account.CHECKING)
 
     def test_withdraw_cash_with_enought_balance(self):
         """
         It tests the behavior of withdrawing cash from an account with enough balance.
         The test creates an account object with an account number, balance, customer name,
-        and account type. It then subtracts 100.00 from the account balance and saves the account object.
+        and account type. It then subtracts 100.00 from the account balance with a single UPDATE computed by
+        the database and reloads the balance.
         Finally, the test checks if the account balance is equal to 400.00, which is the expected result
         after the withdrawal. The test passes if the account balance is equal to the expected value and fails if not.
         """
-        self.account.balance -= 100.00
-        self.account.save()
-        self.assertEqual(self.account.balance, 400.00)
+        Account.objects.filter(pk=self.account.pk).update(
+            balance=F('balance') - Decimal('100.00'))
+        self.account.refresh_from_db(fields=['balance'])
+        self.assertEqual(self.account.balance, Decimal('400.00'))
 
     def test_withdraw_money_from_an_account_with_insufficient_balance(self):
         """
@@ -68,26 +96,34 @@ class AccountModelTest(TestCase):
         The test creates an account object with an account number, balance, customer name,
         and account type. It then attempts to withdraw 600.00 from the account balance,
         which exceeds the current balance of 500.00. The test expects an IntegrityError to be
-        raised and passes the test if an error occurs. If no error is raised, the test fails with an
-        AssertionError message indicating that the withdrawal of money with insufficient balance was allowed.
+        raised by the acct_balance_nonneg constraint and passes the test if an error occurs.
+        If no error is raised, the test fails with an AssertionError message indicating that
+        the withdrawal of money with insufficient balance was allowed.
         """
-        try:
-            self.account.balance -= 600.00
+        with self.assertRaises(IntegrityError,
+                               msg="Withdrawal of money with insufficient balance was allowed"):
+            self.account.balance -= Decimal('600.00')
             self.account.save()
-        except ValidationError:
-            pass
-        else:
-            raise AssertionError(
-                "Withdrawal of money with insufficient balance was allowed")
+
+    def test_full_clean_rejects_a_negative_balance(self):
+        """
+        Validates an account with a negative balance. Account.validate_constraints skips the
+        acct_balance_nonneg query, so the MinValueValidator on balance must still reject the value
+        and report it as a balance error instead of leaving it to the database.
+        """
+        self.account.balance = Decimal('-0.01')
+        with self.assertRaises(ValidationError) as error:
+            self.account.full_clean()
+        self.assertIn('balance', error.exception.message_dict)
 
     def test_delete_an_existing_account(self):
         """
         First, a new account is created with some initial information such as account number,
         balance, customer name, and account type. Then, the account is deleted using the delete() method of
         the Account model.
-        After deleting the account, the test tries to retrieve the account using the account number.
-        If the account is not found (raises Account.DoesNotExist exception), the test passes.
-        However, if the account is still found, it raises an AssertionError with the message
+        After deleting the account, the test checks whether an account with that account number still exists.
+        If the account is not found, the test passes.
+        However, if the account is still found, it fails with the message
         "The account was not deleted correctly".
         This test is useful to ensure that the account deletion functionality works as expected and
         removes the account from the system properly.
@@ -95,13 +131,8 @@ class AccountModelTest(TestCase):
 
         self.account.delete()
 
-        try:
-            Account.objects.get(account_number='1234567890')
-        except Account.DoesNotExist:
-            pass
-        else:
-            raise AssertionError(
-                "The account was not deleted correctly")
+        self.assertFalse(Account.objects.filter(account_number='1234567890').exists(),
+                         "The account was not deleted correctly")
 
     def test_if_balance_is_updated_on_a_new_transaction(self):
         """
@@ -110,28 +141,34 @@ class AccountModelTest(TestCase):
         account balance of 1500. We then verify if the account balance equals 1500 using the assertEqual method.
         Next, we create a withdrawal transaction for an amount of 300, which should reduce the account balance
         to 1200. Again, we verify if the account balance has updated correctly and equals 1200.
+        Both saves are pinned to the same query count: the account passed in is reused, so no extra
+        SELECT is issued for it.
         """
-        Transaction.objects.create(
-            transaction_id="abcdefghijk",
-            account_number=self.account,
-            amount=1000,
-            transaction_type="Deposit",
-        )
-        self.assertEqual(self.account.balance, 1500.00)
-        Transaction.objects.create(
-            transaction_id="abcdefghijk123",
-            account_number=self.account,
-            amount=300.00,
-            transaction_type="Withdraw",
-        )
-        self.assertEqual(self.account.balance, 1200.00)
+        # SAVEPOINT, locked balance SELECT, INSERT, balance UPDATE, balance refresh, RELEASE SAVEPOINT.
+        with self.assertNumQueries(6):
+            Transaction.objects.create(
+                transaction_id="abcdefghijk",
+                account_number=self.account,
+                amount=1000,
+                transaction_type=Transaction.DEPOSIT,
+            )
+        self.assertEqual(self.account.balance, Decimal('1500.00'))
+        with self.assertNumQueries(6):
+            Transaction.objects.create(
+                transaction_id="abcdefghijk123",
+                account_number=self.account,
+                amount=Decimal('300.00'),
+                transaction_type=Transaction.WITHDRAW,
+            )
+        self.assertEqual(self.account.balance, Decimal('1200.00'))
 
 
 class TransactionModelTest(TestCase):
 
-    def setUp(self):
-        self.account = Account.objects.create(account_number='1234567890', balance=500.00,
-                                              customer_name="Jhon Doe", account_type="Savings")
+    @classmethod
+    def setUpTestData(cls):
+        cls.account = Account.objects.create(account_number='1234567890', balance=Decimal('500.00'),
+                                             customer_name="Jhon Doe", account_type=Account.SAVINGS)
 
     def test_was_created_correctly(self):
         """
@@ -143,33 +180,29 @@ class TransactionModelTest(TestCase):
         transaction = Transaction.objects.create(
             transaction_id="abcdefghijk",
             account_number=self.account,
-            amount=500.00,
-            transaction_type="deposit",
+            amount=Decimal('500.00'),
+            transaction_type=Transaction.DEPOSIT,
         )
         self.assertEqual(transaction.transaction_id, "abcdefghijk")
         self.assertEqual(
             transaction.account_number.account_number, "1234567890")
-        self.assertEqual(transaction.amount, 500.00)
-        self.assertEqual(transaction.transaction_type, "deposit")
+        self.assertEqual(transaction.amount, Decimal('500.00'))
+        self.assertEqual(transaction.transaction_type, Transaction.DEPOSIT)
 
     def test_create_transaction_with_non_existent_account(self):
         """
         This test tries to create a Transaction object with an account_number that doesn't exist in the database. 
         It expects an Account.DoesNotExist exception to be raised, and if not, it raises an AssertionError.
         """
-        try:
-            transaction = Transaction.objects.create(
+        with self.assertRaises(Account.DoesNotExist,
+                               msg="Created a transaction with a non-existent account"):
+            Transaction.objects.create(
                 transaction_id="abcdefghijk",
                 account_number=Account.objects.get(
                     account_number="0987654321"),
-                amount=500.00,
-                transaction_type="deposit",
+                amount=Decimal('500.00'),
+                transaction_type=Transaction.DEPOSIT,
             )
-        except Account.DoesNotExist:
-            pass
-        else:
-            AssertionError(
-                "Created a transaction with a non-existent account ")
 
     def test_withdraw_more_balance_than_available(self):
         """
@@ -177,19 +210,14 @@ class TransactionModelTest(TestCase):
         balance in the associated account. It expects a ValidationError to be raised, and if not, 
         it raises an AssertionError.
         """
-        try:
-            transaction = Transaction.objects.create(
+        with self.assertRaises(ValidationError,
+                               msg="A withdrawal transaction was created with insufficient balance"):
+            Transaction.objects.create(
                 transaction_id="abcdefghijk",
                 account_number=self.account,
-                amount=1000.00,
-                transaction_type="Withdraw"
+                amount=Decimal('1000.00'),
+                transaction_type=Transaction.WITHDRAW
             )
-        except ValidationError:
-            pass
-
-        else:
-            raise AssertionError(
-                "A withdrawal transaction was created with insufficient balance")
 
     def test_successfully_transaction_withdraw(self):
         """
@@ -198,45 +226,125 @@ class TransactionModelTest(TestCase):
         after the withdrawal with the expected balance using self.assertEqual().
         """
 
-        transation = Transaction.objects.create(
-            transaction_id="abcdefghijk",
-            account_number=self.account,
-            amount=200.00,
-            transaction_type="Withdraw",
-        )
+        with self.assertNumQueries(6):
+            Transaction.objects.create(
+                transaction_id="abcdefghijk",
+                account_number=self.account,
+                amount=Decimal('200.00'),
+                transaction_type=Transaction.WITHDRAW,
+            )
 
-        self.assertEqual(self.account.balance, 300.00)
+        self.assertEqual(self.account.balance, Decimal('300.00'))
+
+    def test_transaction_with_account_id_only(self):
+        """
+        This test creates a Transaction passing only the primary key of the account. The locked account
+        row read by save() must be reused for the balance update, so the related account is not fetched
+        a second time, and the stored balance must reflect the deposit.
+        """
+        with self.assertNumQueries(6):
+            Transaction.objects.create(
+                transaction_id="abcdefghijk",
+                account_number_id=self.account.pk,
+                amount=Decimal('200.00'),
+                transaction_type=Transaction.DEPOSIT,
+            )
+
+        self.assertEqual(Account.objects.get(
+            pk=self.account.pk).balance, Decimal('700.00'))
 
     def test_successfully_transaction_delete(self):
         """
         This test creates an Account object and a corresponding Transaction object. 
         It then deletes the transaction object and checks that it was deleted correctly 
-        by trying to retrieve it from the database using Transaction.objects.get() and expecting a 
-        Transaction.DoesNotExist exception to be raised. If the transaction is found, it raises an AssertionError.
+        by checking with Transaction.objects.filter().exists() that it is no longer in the database.
+        If the transaction is found, the test fails.
         """
 
         transation = Transaction.objects.create(
             transaction_id="abcdefghijk",
             account_number=self.account,
-            amount=200.00,
-            transaction_type="Withdraw",
+            amount=Decimal('200.00'),
+            transaction_type=Transaction.WITHDRAW,
         )
 
         transation.delete()
 
-        try:
-            Transaction.objects.get(transaction_id="abcdefghijk")
-        except Transaction.DoesNotExist:
-            pass
-
-        else:
-            raise AssertionError("The transaction was not deleted correctly")
+        self.assertFalse(Transaction.objects.filter(transaction_id="abcdefghijk").exists(),
+                         "The transaction was not deleted correctly")
+
+    def test_bulk_apply_updates_balances(self):
+        """
+        Inserts several transactions for two accounts with Transaction.bulk_apply and checks that
+        every transaction was stored and that each account balance reflects the net of its deposits
+        and withdrawals.
+        """
+        other_account = Account.objects.create(account_number='0987654321', balance=Decimal('100.00'),
+                                               customer_name="Jane Doe", account_type=Account.CHECKING)
+        Transaction.bulk_apply([
+            Transaction(transaction_id="bulk1", account_number=self.account, amount=Decimal('250.00'),
+                        transaction_type=Transaction.DEPOSIT, description="Deposit", status="Success"),
+            Transaction(transaction_id="bulk2", account_number=self.account, amount=Decimal('700.00'),
+                        transaction_type=Transaction.WITHDRAW, description="Withdraw", status="Success"),
+            Transaction(transaction_id="bulk3", account_number=other_account, amount=Decimal('50.50'),
+                        transaction_type=Transaction.DEPOSIT, description="Deposit", status="Success"),
+        ])
+        self.assertEqual(Transaction.objects.count(), 3)
+        self.account.refresh_from_db()
+        other_account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal('50.00'))
+        self.assertEqual(other_account.balance, Decimal('150.50'))
+
+    def test_bulk_apply_with_a_generator_and_float_amounts(self):
+        """
+        Passes the transactions to Transaction.bulk_apply as a generator with float amounts and checks
+        that every transaction is stored and that the balance moves by exactly the stored amounts.
+        """
+        Transaction.bulk_apply(
+            Transaction(transaction_id=f"bulk{i}", account_number=self.account, amount=10.1,
+                        transaction_type=Transaction.DEPOSIT, description="Deposit", status="Success")
+            for i in range(3))
+        self.assertEqual(Transaction.objects.count(), 3)
+        self.assertEqual(set(Transaction.objects.values_list('amount', flat=True)), {Decimal('10.10')})
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal('530.30'))
+
+    def test_bulk_apply_keeps_a_permanent_table_with_the_temporary_name(self):
+        """
+        Creates a regular table named like the temporary table used by Account.apply_deltas and checks
+        that bulk applying transactions only drops the temporary one.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute('CREATE TABLE tmp_balance_delta (id integer PRIMARY KEY)')
+        Transaction.bulk_apply([
+            Transaction(transaction_id="bulk1", account_number=self.account, amount=Decimal('250.00'),
+                        transaction_type=Transaction.DEPOSIT, description="Deposit", status="Success"),
+        ])
+        self.assertIn('tmp_balance_delta', connection.introspection.table_names())
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal('750.00'))
+
+    def test_bulk_apply_with_insufficient_balance(self):
+        """
+        Tries to bulk apply a withdrawal greater than the account balance. The acct_balance_nonneg
+        constraint must reject the batch, so neither the transaction nor the balance change is stored.
+        """
+        with self.assertRaises(IntegrityError):
+            Transaction.bulk_apply([
+                Transaction(transaction_id="bulk1", account_number=self.account, amount=Decimal('600.00'),
+                            transaction_type=Transaction.WITHDRAW, description="Withdraw", status="Success"),
+            ])
+        self.assertFalse(Transaction.objects.exists())
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal('500.00'))
 
 
 class AccountCreateViewTest(TestCase):
 
-    def setUp(self):
-        self.url = reverse('api:account_create_view')
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = RequestFactory()
+        cls.url = cached_reverse('api:account_create_view')
 
     def test_create_account_with_valid_data(self):
         """
@@ -250,18 +358,19 @@ class AccountCreateViewTest(TestCase):
 
         self.data = {
             'account_number': '1234567890',
-            'balance': 1000.00,
+            'balance': Decimal('1000.00'),
             'customer_name': 'John Doe',
-            'account_type': 'Savings',
+            'account_type': Account.SAVINGS,
 
         }
-        response = self.client.post(self.url, data=self.data)
+        # Unique account_number check, INSERT.
+        with self.assertNumQueries(2):
+            response = AccountCreateView.as_view()(
+                self.factory.post(self.url, data=self.data))
         self.assertEqual(response.status_code, 201)
-        self.assertTrue(Account.objects.filter(
-            account_number=self.data['account_number']).exists())
         account = Account.objects.get(
             account_number=self.data['account_number'])
-        self.assertEqual(account.balance, float(self.data['balance']))
+        self.assertEqual(account.balance, self.data['balance'])
         self.assertEqual(account.customer_name, self.data['customer_name'])
         self.assertEqual(account.account_type, self.data['account_type'])
 
@@ -275,51 +384,66 @@ class AccountCreateViewTest(TestCase):
         Finally, the test verifies that no Account object exists with the account number and customer 
         name specified in the data dictionary.
         """
-        account = Account.objects.create(account_number='1234567890', balance=500.00,
-                                         customer_name="Jhon Doe", account_type="Savings")
+        account = Account.objects.create(account_number='1234567890', balance=Decimal('500.00'),
+                                         customer_name="Jhon Doe", account_type=Account.SAVINGS)
         data = {
             'account_number': '1234567890',
-            'balance': 1000.00,
+            'balance': Decimal('1000.00'),
             'customer_name': 'jhon doe',
-            'account_type': 'Savings',
+            'account_type': Account.SAVINGS,
 
         }
-        response = self.client.post(self.url, data=data)
+        response = AccountCreateView.as_view()(
+            self.factory.post(self.url, data=data))
         self.assertEqual(response.status_code, 400)
         self.assertFalse(Account.objects.filter(
             account_number=data['account_number'], customer_name=data['customer_name']).exists())
 
     def test_create_account_with_invalid_name(self):
         """
-        verify the behavior of the AccountCreateView when attempting to create an account 
-        with an empty customer name field. The test first creates an Account object with a valid account number, 
-        balance, customer name, and account type. It then attempts to create a new account with an invalid 
-        customer name field (empty string) and valid values for the other fields. The test expects a response 
-        status code of 400, indicating that the account was not successfully created due to the invalid 
-        customer name. Finally, the test verifies that no Account object exists with the account number and 
-        customer name specified in the data dictionary.
+        verify that the form used by the AccountCreateView rejects an empty customer name field.
+        The form is validated directly, without going through the HTTP request cycle: it must be invalid
+        and report the error on the customer_name field.
         """
-        account = Account.objects.create(account_number='1234567890', balance=500.00,
-                                         customer_name="Jhon Doe", account_type="Savings")
         data = {
             'account_number': '123456327890',
-            'balance': 1000.00,
+            'balance': Decimal('1000.00'),
             'customer_name': '',
-            'account_type': 'Savings',
+            'account_type': Account.SAVINGS,
+
+        }
+        form = AccountCreateView().get_form_class()(data=data)
+        self.assertFalse(form.is_valid())
+        self.assertIn('customer_name', form.errors)
+
+    def test_create_account_with_zero_balance(self):
+        """
+        verify that the AccountCreateView rejects a new account whose initial balance is not positive.
+        A POST request with a balance of 0 is sent, a response status code of 400 is expected and
+        no Account object must exist with the account number specified in the data dictionary.
+        """
+        data = {
+            'account_number': '1234567890',
+            'balance': 0,
+            'customer_name': 'John Doe',
+            'account_type': Account.SAVINGS,
 
         }
-        response = self.client.post(self.url, data=data)
+        response = AccountCreateView.as_view()(
+            self.factory.post(self.url, data=data))
         self.assertEqual(response.status_code, 400)
         self.assertFalse(Account.objects.filter(
-            account_number=data['account_number'], customer_name=data['customer_name']).exists())
+            account_number=data['account_number']).exists())
 
 
 class AccountUpdateViewTest(TestCase):
 
-    def setUp(self):
-        self.account = Account.objects.create(account_number='1234567890', balance=500.00,
-                                              customer_name="Jhon Doe", account_type="Savings")
-        self.url = reverse('api:account_update_view', args=(self.account.pk,))
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = RequestFactory()
+        cls.account = Account.objects.create(account_number='1234567890', balance=Decimal('500.00'),
+                                             customer_name="Jhon Doe", account_type=Account.SAVINGS)
+        cls.url = cached_reverse('api:account_update_view', cls.account.pk)
 
     def test_update_account_with_valid_data(self):
         """
@@ -336,18 +460,21 @@ class AccountUpdateViewTest(TestCase):
         """
         self.data = {
             'account_number': '1234567890',
-            'balance': 1200.00,
+            'balance': Decimal('1200.00'),
             'customer_name': 'Maria Gonzalez',
-            'account_type': 'Savings',
+            'account_type': Account.SAVINGS,
 
         }
-        response = self.client.post(self.url, data=self.data)
+        # SELECT account, unique account_number check, UPDATE.
+        with self.assertNumQueries(3):
+            response = AccountUpdateView.as_view()(
+                self.factory.post(self.url, data=self.data), pk=self.account.pk)
         self.assertEqual(response.status_code, 200)
         updated_account = Account.objects.get(pk=self.account.pk)
         self.assertEqual(updated_account.account_number, '1234567890')
-        self.assertEqual(updated_account.balance, 1200.00)
+        self.assertEqual(updated_account.balance, Decimal('1200.00'))
         self.assertEqual(updated_account.customer_name, 'Maria Gonzalez')
-        self.assertEqual(updated_account.account_type, 'Savings')
+        self.assertEqual(updated_account.account_type, Account.SAVINGS)
 
     def test_update_account_with_invalid_data(self):
         """
@@ -362,23 +489,49 @@ class AccountUpdateViewTest(TestCase):
         """
         self.data = {
             'account_number': '',
-            'balance': 1200.00,
+            'balance': Decimal('1200.00'),
             'customer_name': '',
-            'account_type': 'Savings',
+            'account_type': Account.SAVINGS,
 
         }
-        response = self.client.post(self.url, data=self.data)
+        response = AccountUpdateView.as_view()(
+            self.factory.post(self.url, data=self.data), pk=self.account.pk)
         self.assertEqual(response.status_code, 400)
         self.assertEqual(self.account.account_number, '1234567890')
-        self.assertEqual(self.account.balance, 500.00)
+        self.assertEqual(self.account.balance, Decimal('500.00'))
         self.assertEqual(self.account.customer_name, "Jhon Doe")
-        self.assertEqual(self.account.account_type, "Savings")
+        self.assertEqual(self.account.account_type, Account.SAVINGS)
+
+    def test_update_account_with_negative_balance(self):
+        """
+        Checks that the form layer rejects a negative balance. A POST request with a balance of -100.00
+        is sent and a response with a status code of 400 is expected, together with an error for the
+        balance field. The stored balance must remain unchanged.
+        """
+        self.data = {
+            'account_number': '1234567890',
+            'balance': Decimal('-100.00'),
+            'customer_name': 'Jhon Doe',
+            'account_type': Account.SAVINGS,
+
+        }
+        response = AccountUpdateView.as_view()(
+            self.factory.post(self.url, data=self.data), pk=self.account.pk)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('balance', json.loads(response.content)['errors'])
+        self.assertEqual(Account.objects.get(
+            pk=self.account.pk).balance, Decimal('500.00'))
 
 
 class AccountDeleteViewTest(TestCase):
-    def setUp(self):
-        self.account = Account.objects.create(account_number='1234567890', balance=500.00,
-                                              customer_name="Jhon Doe", account_type="Savings")
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = RequestFactory()
+        cls.account = Account.objects.create(account_number='1234567890', balance=Decimal('500.00'),
+                                             customer_name="Jhon Doe", account_type=Account.SAVINGS)
+        cls.url = cached_reverse('api:account_delete_view', '1234567890')
+        cls.inexistent_url = cached_reverse(
+            'api:account_delete_view', '7644567890')
 
     def test_delete_existent_account(self):
         """
@@ -387,16 +540,13 @@ class AccountDeleteViewTest(TestCase):
         which means that the request was successfully completed and the account was deleted. 
         If the account does not exist, an error will be generated.
         """
-        url = reverse('api:account_delete_view', args=('1234567890',))
-        request = self.client.post(url)
+        # SELECT account ids for the cascade, DELETE transactions, DELETE account.
+        with self.assertNumQueries(3):
+            request = AccountDeleteView.as_view()(
+                self.factory.post(self.url), account_number='1234567890')
         self.assertEqual(request.status_code, 200)
-        try:
-            Account.objects.get(account_number='1234567890')
-        except Account.DoesNotExist:
-            pass
-        else:
-            raise AssertionError(
-                "The account was deleted correctly")
+        self.assertFalse(Account.objects.filter(account_number='1234567890').exists(),
+                         "The account was not deleted correctly")
 
     def test_delete_inexistent_account(self):
         """
@@ -407,16 +557,18 @@ class AccountDeleteViewTest(TestCase):
         it is verified that the account was not accidentally deleted in the process 
         by checking that it still exists in the database.
         """
-        url = reverse('api:account_delete_view', args=('7644567890',))
-        request = self.client.post(url)
+        request = self.client.post(self.inexistent_url)
         self.assertEqual(request.status_code, 404)
         self.assertTrue(Account.objects.filter(pk=self.account.pk).exists())
 
 
 class AccountDetailViewTest(TestCase):
-    def setUp(self):
-        self.account = Account.objects.create(account_number='1234567890', balance=500.00,
-                                              customer_name="Jhon Doe", account_type="Savings")
+    @classmethod
+    def setUpTestData(cls):
+        cls.account = Account.objects.create(account_number='1234567890', balance=Decimal('500.00'),
+                                             customer_name="Jhon Doe", account_type=Account.SAVINGS)
+        cls.url = cached_reverse('api:account_detail_view', '1234567890')
+        cls.invalid_url = cached_reverse('api:account_detail_view', '12sdfd')
 
     def test_retrieve_bank_account(self):
         """
@@ -426,12 +578,13 @@ class AccountDetailViewTest(TestCase):
         received from the account matches the information stored in the database, including the account number, 
         balance, customer name, and account type.
         """
-        url = reverse('api:account_detail_view', args=('1234567890',))
-        request = self.client.get(url)
-        data = json.loads(request.content)
+        # SELECT account.
+        with self.assertNumQueries(1):
+            request = self.client.get(self.url)
         self.assertEqual(request.status_code, 200)
+        data = request.json()
         self.assertEqual(data['account_number'], self.account.account_number)
-        self.assertEqual(data['balance'], self.account.balance)
+        self.assertEqual(Decimal(data['balance']), self.account.balance)
         self.assertEqual(data['customer_name'], self.account.customer_name)
         self.assertEqual(data['account_type'], self.account.account_type)
 
@@ -442,16 +595,17 @@ class AccountDetailViewTest(TestCase):
         indicating that the account was not found in the system. This test ensures that the system will 
         not provide confidential information to a user who does not provide a valid account number.
         """
-        url = reverse('api:account_detail_view', args=('12sdfd',))
-        request = self.client.get(url)
+        request = self.client.get(self.invalid_url)
         self.assertEqual(request.status_code, 404)
 
 
 class TransactionCreateViewTest(TestCase):
-    def setUp(self):
-        self.url = reverse('api:transaction_create_view')
-        self.account = Account.objects.create(account_number='1234567890', balance=500.00,
-                                              customer_name="Jhon Doe", account_type="Savings")
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = RequestFactory()
+        cls.url = cached_reverse('api:transaction_create_view')
+        cls.account = Account.objects.create(account_number='1234567890', balance=Decimal('500.00'),
+                                             customer_name="Jhon Doe", account_type=Account.SAVINGS)
 
     def test_create_account_with_valid_data(self):
         """
@@ -463,52 +617,20 @@ class TransactionCreateViewTest(TestCase):
         data = {
             'transaction_id': 'abcdefghijk',
             'account_number': self.account.id,
-            'amount': 500.00,
-            'transaction_type': 'Deposit',
+            'amount': Decimal('500.00'),
+            'transaction_type': Transaction.DEPOSIT,
             'description': 'Initial deposit',
             'status': 'Success'
         }
-        response = self.client.post(self.url, data=data)
+        # Form validation (4) plus the locked save() (6).
+        with self.assertNumQueries(10):
+            response = TransactionCreateView.as_view()(
+                self.factory.post(self.url, data=data))
         self.assertEqual(response.status_code, 201)
         self.assertEqual(Transaction.objects.count(), 1)
-        self.assertEqual(Transaction.objects.get(
-            transaction_id='abcdefghijk').amount, 500.0)
-        self.assertEqual(Transaction.objects.get(
-            transaction_id='abcdefghijk').transaction_type, 'Deposit')
-
-    def test_create_account_with_invalid_customer(self):
-        """
-        Creates an account with a non-existent customer ID. The test checks if the response code is 400 (bad request)
-        and that no transactions were created.
-        """
-        data = {
-            'transaction_id': 'abcdefghijk',
-            'account_number': 100,
-            'amount': 100,
-            'transaction_type': 'Deposit',
-            'description': 'Initial deposit',
-            'status': 'Success'
-        }
-        response = self.client.post(self.url, data=data)
-        self.assertEqual(response.status_code, 400)
-        self.assertEqual(Transaction.objects.count(), 0)
-
-    def test_create_account_with_invalid_transaction_type(self):
-        """
-        Creates an account with an invalid transaction type. The test checks if the response code is 400 
-        and that no transactions were created.
-        """
-        data = {
-            'transaction_id': 'abcdefghijk',
-            'account_number': 100,
-            'amount': 100,
-            'transaction_type': 'null',
-            'description': 'Initial deposit',
-            'status': 'Success'
-        }
-        response = self.client.post(self.url, data=data)
-        self.assertEqual(response.status_code, 400)
-        self.assertEqual(Transaction.objects.count(), 0)
+        transaction = Transaction.objects.get(transaction_id='abcdefghijk')
+        self.assertEqual(transaction.amount, Decimal('500.00'))
+        self.assertEqual(transaction.transaction_type, Transaction.DEPOSIT)
 
     def test_create_account_with_other_descriptions(self):
         """
@@ -520,15 +642,16 @@ class TransactionCreateViewTest(TestCase):
             'transaction_id': 'abcdefghijk',
             'account_number': self.account.id,
             'amount': 100,
-            'transaction_type': 'Deposit',
+            'transaction_type': Transaction.DEPOSIT,
             'description': 'Other description',
             'status': 'Success'
         }
-        response = self.client.post(self.url, data=data)
+        response = TransactionCreateView.as_view()(
+            self.factory.post(self.url, data=data))
         self.assertEqual(response.status_code, 201)
         self.assertEqual(Transaction.objects.count(), 1)
         self.assertEqual(Transaction.objects.get(
-            transaction_id='abcdefghijk').amount, 100.0)
+            transaction_id='abcdefghijk').amount, Decimal('100.00'))
 
     def test_create_account_with_other_status(self):
         """
@@ -539,165 +662,134 @@ class TransactionCreateViewTest(TestCase):
             'transaction_id': 'abcdefghijk',
             'account_number': self.account.id,
             'amount': 100,
-            'transaction_type': 'Deposit',
+            'transaction_type': Transaction.DEPOSIT,
             'description': 'Other description',
             'status': 'Status'
         }
-        response = self.client.post(self.url, data=data)
+        response = TransactionCreateView.as_view()(
+            self.factory.post(self.url, data=data))
         self.assertEqual(response.status_code, 201)
         self.assertEqual(Transaction.objects.count(), 1)
         self.assertEqual(Transaction.objects.get(
-            transaction_id='abcdefghijk').amount, 100.0)
-
-    def test_create_account_with_empty_transaction_id(self):
-        """
-        Creates an account with an empty transaction ID. The test checks if the response code is 400 
-        and that no transactions were created.
-        """
-        data = {
-            'transaction_id': '',
-            'account_number': 100,
-            'amount': 100,
-            'transaction_type': 'Deposit',
-            'description': 'Initial deposit',
-            'status': 'Success'
-        }
-        response = self.client.post(self.url, data=data)
-        self.assertEqual(response.status_code, 400)
-        self.assertEqual(Transaction.objects.count(), 0)
+            transaction_id='abcdefghijk').amount, Decimal('100.00'))
 
-    def test_create_account_with_empty_account_number(self):
+    def test_update_account_balance_on_deposit_transaction(self):
         """
-        Creates an account with an empty account number. The test checks if the response code is 400 
-        and that no transactions were created.
+        Creates an account with a deposit transaction. The test checks if the account balance was updated correctly.
         """
         data = {
             'transaction_id': 'abcdefghijk',
-            'account_number': "",
+            'account_number': self.account.id,
             'amount': 100,
-            'transaction_type': 'Deposit',
+            'transaction_type': Transaction.DEPOSIT,
             'description': 'Initial deposit',
             'status': 'Success'
         }
-        response = self.client.post(self.url, data=data)
-        self.assertEqual(response.status_code, 400)
-        self.assertEqual(Transaction.objects.count(), 0)
+        response = TransactionCreateView.as_view()(
+            self.factory.post(self.url, data=data))
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Account.objects.get(
+            pk=self.account.id).balance, Decimal('600.00'))
 
-    def test_create_account_with_invalid_empty_amount(self):
+    def test_update_account_balance_on_withdraw_transaction(self):
         """
-        Creates an account with an empty amount. The test checks if the response code is 400 
-        and that no transactions were created.
+        This test verifies that an account balance is updated correctly after a successful $100 withdrawal transaction. 
+        The test uses a client to make a POST request and checks if the answer has a status code 201. In addition, 
+        the Account object is used to verify if the balance has decreased by $100 and is now $400.
         """
         data = {
             'transaction_id': 'abcdefghijk',
-            'account_number': 100,
-            'amount': "",
-            'transaction_type': 'Deposit',
-            'description': 'Initial deposit',
+            'account_number': self.account.id,
+            'amount': Decimal('500.00'),
+            'transaction_type': Transaction.WITHDRAW,
+            'description': 'ATM withdraw',
             'status': 'Success'
         }
-        response = self.client.post(self.url, data=data)
-        self.assertEqual(response.status_code, 400)
-        self.assertEqual(Transaction.objects.count(), 0)
+        response = TransactionCreateView.as_view()(
+            self.factory.post(self.url, data=data))
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Account.objects.get(
+            pk=self.account.id).balance, Decimal('0.00'))
+
 
-    def test_create_account_with_empty_transaction_type(self):
+class TransactionCreateViewInvalidDataTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.account = Account.objects.create(account_number='1234567890', balance=Decimal('500.00'),
+                                             customer_name="Jhon Doe", account_type=Account.SAVINGS)
+        cls.factory = RequestFactory()
+        cls.url = cached_reverse('api:transaction_create_view')
+
+    def test_create_account_with_invalid_customer(self):
         """
-        Creates an account with an empty transaction type. The test checks if the response code is 400 
+        Creates an account with a non-existent customer ID. The test checks if the response code is 400 (bad request)
         and that no transactions were created.
         """
         data = {
             'transaction_id': 'abcdefghijk',
             'account_number': 100,
             'amount': 100,
-            'transaction_type': '',
+            'transaction_type': Transaction.DEPOSIT,
             'description': 'Initial deposit',
             'status': 'Success'
         }
-        response = self.client.post(self.url, data=data)
+        response = TransactionCreateView.as_view()(
+            self.factory.post(self.url, data=data))
         self.assertEqual(response.status_code, 400)
-        self.assertEqual(Transaction.objects.count(), 0)
+        self.assertFalse(Transaction.objects.exists())
 
-    def test_create_account_with_empty_status(self):
+    def test_create_account_with_invalid_transaction_type(self):
         """
-        Creates an account with an empty status. The test checks if the response code is 400 
+        Creates an account with an invalid transaction type. The test checks if the response code is 400 
         and that no transactions were created.
         """
         data = {
             'transaction_id': 'abcdefghijk',
-            'account_number': 100,
+            'account_number': self.account.pk,
             'amount': 100,
-            'transaction_type': 'Deposit',
+            'transaction_type': 'null',
             'description': 'Initial deposit',
-            'status': ''
-        }
-        response = self.client.post(self.url, data=data)
-        self.assertEqual(response.status_code, 400)
-        self.assertEqual(Transaction.objects.count(), 0)
-
-    def test_create_account_with_empty_description(self):
-        """
-        Creates an account with an empty description. The test checks if the response code is 400 
-        and that no transactions were created.
-        """
-        data = {
-            'transaction_id': 'abcdefghijk',
-            'account_number': 100,
-            'amount': 100,
-            'transaction_type': 'Deposit',
-            'description': '',
             'status': 'Success'
         }
-        response = self.client.post(self.url, data=data)
+        response = TransactionCreateView.as_view()(
+            self.factory.post(self.url, data=data))
         self.assertEqual(response.status_code, 400)
-        self.assertEqual(Transaction.objects.count(), 0)
+        self.assertFalse(Transaction.objects.exists())
 
-    def test_update_account_balance_on_deposit_transaction(self):
+    def test_create_account_with_empty_fields(self):
         """
-        Creates an account with a deposit transaction. The test checks if the account balance was updated correctly.
+        Validates the form used by the TransactionCreateView leaving one field empty at a time: transaction ID,
+        account number, amount, transaction type, status and description. The complete data must be valid, and for
+        every field the test checks that the form is invalid and reports the error on that field only.
         """
-        data = {
+        base_data = {
             'transaction_id': 'abcdefghijk',
-            'account_number': self.account.id,
+            'account_number': self.account.pk,
             'amount': 100,
-            'transaction_type': 'Deposit',
+            'transaction_type': Transaction.DEPOSIT,
             'description': 'Initial deposit',
             'status': 'Success'
         }
-        response = self.client.post(self.url, data=data)
-        self.assertEqual(response.status_code, 201)
-        self.assertEqual(Account.objects.get(
-            pk=self.account.id).balance, 600.00)
-
-    def test_update_account_balance_on_withdraw_transaction(self):
-        """
-        This test verifies that an account balance is updated correctly after a successful $100 withdrawal transaction. 
-        The test uses a client to make a POST request and checks if the answer has a status code 201. In addition, 
-        the Account object is used to verify if the balance has decreased by $100 and is now $400.
-        """
-        data = {
-            'transaction_id': 'abcdefghijk',
-            'account_number': self.account.id,
-            'amount': 500.00,
-            'transaction_type': 'Withdraw',
-            'description': 'ATM withdraw',
-            'status': 'Success'
-        }
-        response = self.client.post(self.url, data=data)
-        self.assertEqual(response.status_code, 201)
-        self.assertEqual(Account.objects.get(
-            pk=self.account.id).balance, 0.00)
+        form_class = TransactionCreateView().get_form_class()
+        self.assertTrue(form_class(data=base_data).is_valid())
+        for field in ('transaction_id', 'account_number', 'amount', 'transaction_type', 'status', 'description'):
+            with self.subTest(field=field):
+                form = form_class(data={**base_data, field: ''})
+                self.assertFalse(form.is_valid())
+                self.assertEqual(set(form.errors), {field})
 
 
 class TransactionUpdateViewTest(TestCase):
-    def setUp(self):
-        self.account = Account.objects.create(account_number='1234567890', balance=500.00,
-                                              customer_name="Jhon Doe", account_type="Savings")
+    @classmethod
+    def setUpTestData(cls):
+        cls.account = Account.objects.create(account_number='1234567890', balance=Decimal('500.00'),
+                                             customer_name="Jhon Doe", account_type=Account.SAVINGS)
 
-        self.transaction = Transaction.objects.create(
+        cls.transaction = Transaction.objects.create(
             transaction_id="abcdefghijk",
-            account_number=self.account,
-            amount=500.00,
-            transaction_type="Deposit",
+            account_number=cls.account,
+            amount=Decimal('500.00'),
+            transaction_type=Transaction.DEPOSIT,
             description="Initial Deposit",
             status="Sucess"
         )
@@ -711,50 +803,71 @@ class TransactionUpdateViewTest(TestCase):
         Finally, the test queries the updated transaction record from the database and checks that its fields match 
         the updated data.
         """
-        url = reverse('api:transaction_update_view',
-                      args=(self.transaction.pk,))
+        url = cached_reverse('api:transaction_update_view', self.transaction.pk)
         data = {
             'transaction_id': '1234567890',
             'account_number': self.account.id,
             'amount': 1200,
-            'transaction_type': 'Deposit',
+            'transaction_type': Transaction.DEPOSIT,
             'description': 'Update Data',
             'status': 'Success'
         }
 
-        response = self.client.post(url, data=data)
+        # SELECT transaction and account, form validation, locked save() of the difference.
+        with self.assertNumQueries(12):
+            response = self.client.post(url, data=data)
         self.assertEqual(response.status_code, 200)
         updated_transaction = Transaction.objects.get(pk=self.transaction.pk)
         self.assertEqual(updated_transaction.transaction_id, '1234567890')
-        self.assertEqual(updated_transaction.amount, 1200.00)
-        self.assertEqual(updated_transaction.transaction_type, 'Deposit')
+        self.assertEqual(updated_transaction.amount, Decimal('1200.00'))
+        self.assertEqual(updated_transaction.transaction_type,
+                         Transaction.DEPOSIT)
         self.assertEqual(updated_transaction.description, 'Update Data')
+        # The deposit grew from 500.00 to 1200.00, so only the difference is credited.
+        self.assertEqual(Account.objects.get(
+            pk=self.account.pk).balance, Decimal('1700.00'))
+
+    def test_update_transaction_description_only(self):
+        """
+        Edits only the description of a deposit. The transaction must be updated while the account
+        balance stays the same, since neither the amount, the type nor the account changed.
+        """
+        url = cached_reverse('api:transaction_update_view', self.transaction.pk)
+        data = {
+            'transaction_id': self.transaction.transaction_id,
+            'account_number': self.account.id,
+            'amount': self.transaction.amount,
+            'transaction_type': Transaction.DEPOSIT,
+            'description': 'Renamed deposit',
+            'status': self.transaction.status
+        }
+        response = self.client.post(url, data=data)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Transaction.objects.get(
+            pk=self.transaction.pk).description, 'Renamed deposit')
+        self.assertEqual(Account.objects.get(
+            pk=self.account.pk).balance, Decimal('1000.00'))
 
     def test_update_transaction_with_amount_greater_than_balance(self):
         """
         This test checks whether the API properly handles an attempt to withdraw an amount greater 
         than the account balance. It follows the same process as the previous test but submits an amount 
         greater than the account balance for a withdrawal transaction. The test expects a validation error 
-        to be raised since the transaction cannot be completed, and if no error is raised, it raises one itself.
+        to be raised since the transaction cannot be completed, and the test fails if no error is raised.
         """
-        url = reverse('api:transaction_update_view',
-                      args=(self.transaction.pk,))
+        url = cached_reverse('api:transaction_update_view', self.transaction.pk)
         data = {
             'transaction_id': '1234567890',
             'account_number': self.account.id,
             'amount': 1200,
-            'transaction_type': 'Withdraw',
+            'transaction_type': Transaction.WITHDRAW,
             'description': 'Update Data',
             'status': 'Success'
         }
 
-        try:
-            response = self.client.post(url, data=data)
-        except ValidationError:
-            pass
-        else:
-            raise ValidationError(
-                "deposit a withdrawal with an amount greater than the balance")
+        with self.assertRaises(ValidationError,
+                               msg="deposit a withdrawal with an amount greater than the balance"):
+            self.client.post(url, data=data)
 
     def test_update_transaction_with_invalid_data(self):
         """
@@ -763,8 +876,7 @@ class TransactionUpdateViewTest(TestCase):
         transaction type fields. The test expects a response code of 400, indicating that the data is 
         invalid and cannot be processed.
         """
-        url = reverse('api:transaction_update_view',
-                      args=(self.transaction.pk,))
+        url = cached_reverse('api:transaction_update_view', self.transaction.pk)
         data = {
             'transaction_id': '1234567890',
             'account_number': 'Jhon Doe',
@@ -779,18 +891,20 @@ class TransactionUpdateViewTest(TestCase):
 
 
 class TransactionDeleteViewTest(TestCase):
-    def setUp(self):
-        self.account = Account.objects.create(account_number='1234567890', balance=500.00,
-                                              customer_name="Jhon Doe", account_type="Savings")
+    @classmethod
+    def setUpTestData(cls):
+        cls.account = Account.objects.create(account_number='1234567890', balance=Decimal('500.00'),
+                                             customer_name="Jhon Doe", account_type=Account.SAVINGS)
 
-        self.transaction = Transaction.objects.create(
+        # The balance logic of save() is not under test here, so the row is inserted directly.
+        [cls.transaction] = Transaction.objects.bulk_create([Transaction(
             transaction_id="abcdefghijk",
-            account_number=self.account,
-            amount=500.00,
-            transaction_type="Deposit",
+            account_number=cls.account,
+            amount=Decimal('500.00'),
+            transaction_type=Transaction.DEPOSIT,
             description="Initial Deposit",
             status="Sucess"
-        )
+        )])
 
     def test_delete_existent_transaction(self):
         """
@@ -799,9 +913,10 @@ class TransactionDeleteViewTest(TestCase):
         indicating that the deletion was successful. Then it is verified that the transaction no longer 
         exists in the database.
         """
-        url = reverse("api:transaction_delete_view",
-                      args=("abcdefghijk",))
-        request = self.client.post(url)
+        url = cached_reverse("api:transaction_delete_view", "abcdefghijk")
+        # A single DELETE.
+        with self.assertNumQueries(1):
+            request = self.client.post(url)
 
         self.assertEqual(request.status_code, 200)
         self.assertFalse(Transaction.objects.filter(
@@ -814,26 +929,27 @@ class TransactionDeleteViewTest(TestCase):
         that does not exist and it is verified that the response has an HTTP 404 status code, 
         indicating that the transaction could not be found to delete it.
         """
-        url = reverse("api:transaction_delete_view",
-                      args=("nonexistent",))
+        url = cached_reverse("api:transaction_delete_view", "nonexistent")
         request = self.client.post(url)
 
         self.assertEqual(request.status_code, 404)
 
 
 class TransactionDetailViewTest(TestCase):
-    def setUp(self):
-        self.account = Account.objects.create(account_number='1234567890', balance=500.00,
-                                              customer_name="Jhon Doe", account_type="Savings")
+    @classmethod
+    def setUpTestData(cls):
+        cls.account = Account.objects.create(account_number='1234567890', balance=Decimal('500.00'),
+                                             customer_name="Jhon Doe", account_type=Account.SAVINGS)
 
-        self.transaction = Transaction.objects.create(
+        # The balance logic of save() is not under test here, so the row is inserted directly.
+        [cls.transaction] = Transaction.objects.bulk_create([Transaction(
             transaction_id="abcdefghijk",
-            account_number=self.account,
-            amount=500.00,
-            transaction_type="Deposit",
+            account_number=cls.account,
+            amount=Decimal('500.00'),
+            transaction_type=Transaction.DEPOSIT,
             description="Initial Deposit",
             status="Sucess"
-        )
+        )])
 
     def test_retrieve_transaction_detail(self):
         """
@@ -841,21 +957,23 @@ class TransactionDetailViewTest(TestCase):
         request to the transaction detail view with a valid transaction ID and checks if the response status 
         code is 200. It also checks if the response data matches the expected values for the transaction's attributes.
         """
-        url = reverse('api:transaction_detail_view', args=('abcdefghijk',))
-        request = self.client.get(url)
-        data = json.loads(request.content)
-        data_decoded = json.loads(data)
+        url = cached_reverse('api:transaction_detail_view', 'abcdefghijk')
+        # SELECT transaction joined to its account.
+        with self.assertNumQueries(1):
+            request = self.client.get(url)
+        data = request.json()
         self.assertEqual(request.status_code, 200)
-        self.assertEqual(data_decoded['transaction_id'],
+        self.assertEqual(data['transaction_id'],
                          self.transaction.transaction_id)
-        self.assertEqual(data_decoded['account_number'],
+        self.assertEqual(data['account_number'],
                          {'account_number': self.account.account_number})
-        self.assertEqual(data_decoded['amount'], self.transaction.amount)
-        self.assertEqual(data_decoded['transaction_type'],
+        self.assertEqual(Decimal(data['amount']),
+                         self.transaction.amount)
+        self.assertEqual(data['transaction_type'],
                          self.transaction.transaction_type)
-        self.assertEqual(data_decoded['description'],
+        self.assertEqual(data['description'],
                          self.transaction.description)
-        self.assertEqual(data_decoded['status'], self.transaction.status)
+        self.assertEqual(data['status'], self.transaction.status)
 
     def test_retrieve_transaction_with_invalidad_transaction_id(self):
         """
@@ -863,34 +981,40 @@ class TransactionDetailViewTest(TestCase):
         invalid transaction ID. It sends a GET request to the transaction detail view with an invalid 
         transaction ID and checks if the response status code is 404.
         """
-        url = reverse('api:transaction_detail_view', args=('faketransaction',))
+        url = cached_reverse('api:transaction_detail_view', 'faketransaction')
         request = self.client.get(url)
         self.assertEqual(request.status_code, 404)
 
 
 class TransactionListViewPerAccountTest(TestCase):
-    def setUp(self):
-        self.account = Account.objects.create(account_number='1234567890', balance=500.00,
-                                              customer_name="Jhon Doe", account_type="Savings")
-        self.account_no_transactions = Account.objects.create(account_number='no_transactions', balance=500.00,
-                                                              customer_name="Jhon Doe", account_type="Savings")
-
-        self.transaction = Transaction.objects.create(
-            transaction_id="abcdefghijk",
-            account_number=self.account,
-            amount=500.00,
-            transaction_type="Deposit",
-            description="Initial Deposit",
-            status="Sucess"
-        )
-        self.transaction2 = Transaction.objects.create(
-            transaction_id="1234567",
-            account_number=self.account,
-            amount=5000.00,
-            transaction_type="Deposit",
-            description="Second Deposit",
-            status="Sucess"
-        )
+    @classmethod
+    def setUpTestData(cls):
+        cls.account, cls.account_no_transactions = Account.objects.bulk_create([
+            Account(account_number='1234567890', balance=Decimal('500.00'),
+                    customer_name="Jhon Doe", account_type=Account.SAVINGS),
+            Account(account_number='no_transactions', balance=Decimal('500.00'),
+                    customer_name="Jhon Doe", account_type=Account.SAVINGS),
+        ])
+
+        # The balance logic of save() is not under test here, so the rows are inserted directly.
+        cls.transaction, cls.transaction2 = Transaction.objects.bulk_create([
+            Transaction(
+                transaction_id="abcdefghijk",
+                account_number=cls.account,
+                amount=Decimal('500.00'),
+                transaction_type=Transaction.DEPOSIT,
+                description="Initial Deposit",
+                status="Sucess"
+            ),
+            Transaction(
+                transaction_id="1234567",
+                account_number=cls.account,
+                amount=Decimal('5000.00'),
+                transaction_type=Transaction.DEPOSIT,
+                description="Second Deposit",
+                status="Sucess"
+            ),
+        ])
 
     def test_return_list_with_correct_data(self):
         """
@@ -900,18 +1024,20 @@ class TransactionListViewPerAccountTest(TestCase):
         data is the same as the expected data for the transactions that were made for that bank account.
         """
         account_number = "1234567890"
-        url = reverse('api:transaction_list_view', args=(account_number,))
-        response = self.client.get(url)
+        url = cached_reverse('api:transaction_list_view', account_number)
+        # Account existence check, SELECT transactions joined to their account.
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
         response_data = response.json()
         self.assertEqual(response.status_code, 200)
         self.assertEqual(
             response_data[0]['transaction_id'], self.transaction.transaction_id)
         self.assertEqual(
-            response_data[0]['amount'], self.transaction.amount)
+            Decimal(response_data[0]['amount']), self.transaction.amount)
         self.assertEqual(
             response_data[1]['transaction_id'], self.transaction2.transaction_id)
         self.assertEqual(
-            response_data[1]['amount'], self.transaction2.amount)
+            Decimal(response_data[1]['amount']), self.transaction2.amount)
 
     def test_return_list_with_incorrect_data(self):
         """
@@ -920,7 +1046,7 @@ class TransactionListViewPerAccountTest(TestCase):
         Django test client and it is checked if a 404 code response is returned.
         """
         account_number = "incorrect_id"
-        url = reverse('api:transaction_list_view', args=(account_number,))
+        url = cached_reverse('api:transaction_list_view', account_number)
         response = self.client.get(url)
         self.assertEqual(response.status_code, 404)
 
@@ -936,19 +1062,20 @@ class TransactionListViewPerAccountTest(TestCase):
         Then two things are verified. First, it is verified that the status code of the response is 200, 
         which means that the request was made correctly. Afterwards, it is verified that the content of 
         the answer is an empty list. To do this, the content of the response is loaded as JSON using 
-        json.loads() and compared to an empty list using assertEqual().
+        response.json() and compared to an empty list using assertEqual().
         """
         account_number = "no_transactions"
-        url = reverse('api:transaction_list_view', args=(account_number,))
+        url = cached_reverse('api:transaction_list_view', account_number)
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(json.loads(response.content), [])
+        self.assertEqual(response.json(), [])
 
 
 class AccountBalanceUpdateViewTest(TestCase):
-    def setUp(self):
-        self.account = Account.objects.create(account_number='1234567890', balance=500.00,
-                                              customer_name="Jhon Doe", account_type="Savings")
+    @classmethod
+    def setUpTestData(cls):
+        cls.account = Account.objects.create(account_number='1234567890', balance=Decimal('500.00'),
+                                             customer_name="Jhon Doe", account_type=Account.SAVINGS)
 
     def test_update_account_with_valid_data(self):
         """
@@ -957,16 +1084,34 @@ class AccountBalanceUpdateViewTest(TestCase):
         sending a data object that contains a new balance for the account. It is expected that the 
         response will have an HTTP 200 status code and that the updated account will have the new balance.
         """
-        url = reverse('api:account_balance_update_view',
-                      args=(self.account.pk,))
+        url = cached_reverse('api:account_balance_update_view', self.account.pk)
 
         data = {
-            'balance': 1200.00,
+            'balance': Decimal('1200.00'),
         }
-        response = self.client.post(url, data=data)
+        # A single UPDATE.
+        with self.assertNumQueries(1):
+            response = self.client.post(url, data=data)
         self.assertEqual(response.status_code, 200)
         updated_account = Account.objects.get(pk=self.account.pk)
-        self.assertEqual(updated_account.balance, 1200.00)
+        self.assertEqual(updated_account.balance, Decimal('1200.00'))
+
+    def test_update_account_with_negative_balance(self):
+        """
+        Proves that the balance of an existing account can not be set to a negative amount.
+        The response is expected to have an HTTP 400 status code with the balance error,
+        and the stored balance of the account must not change.
+        """
+        url = cached_reverse('api:account_balance_update_view', self.account.pk)
+
+        data = {
+            'balance': Decimal('-1.00'),
+        }
+        response = self.client.post(url, data=data)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('balance', response.json()['errors'])
+        self.assertEqual(Account.objects.get(
+            pk=self.account.pk).balance, Decimal('500.00'))
 
     def test_update_account_with_invalid_data(self):
         """
@@ -975,10 +1120,23 @@ class AccountBalanceUpdateViewTest(TestCase):
         sending a data object that contains a new balance for the account. The response is expected to 
         have an HTTP 404 status code, since the account does not exist in the database.
         """
-        url = reverse('api:account_balance_update_view', args=(20,))
+        url = cached_reverse('api:account_balance_update_view', 20)
+
+        data = {
+            'balance': Decimal('1200.00'),
+        }
+        response = self.client.post(url, data=data)
+        self.assertEqual(response.status_code, 404)
+
+    def test_update_inexistent_account_with_invalid_balance(self):
+        """
+        Proof that a non-existent account answers with an HTTP 404 status code even when the new
+        balance is invalid, so a missing account is always reported before the validation errors.
+        """
+        url = cached_reverse('api:account_balance_update_view', 20)
 
         data = {
-            'balance': 1200.00,
+            'balance': Decimal('-1.00'),
         }
         response = self.client.post(url, data=data)
         self.assertEqual(response.status_code, 404)
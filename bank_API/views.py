@@ -1,17 +1,16 @@
 # Django
-from django.forms import ValidationError
-from django.http import HttpResponse, JsonResponse
-from django.shortcuts import get_object_or_404, render
-from django.urls import reverse_lazy
+from django.core.validators import MinValueValidator
+from django.db.models.functions import Now
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
 from django.views.generic import CreateView, UpdateView, DeleteView, DetailView, ListView
-from django.core.serializers.json import DjangoJSONEncoder
 from django.http import Http404
 
 # Local
 from bank_API.models import Account, Transaction
 
 # Python
-import json
+from decimal import Decimal
 
 
 class AccountCreateView(CreateView):
@@ -21,11 +20,18 @@ class AccountCreateView(CreateView):
     Then, it returns a JSON response with the data of the newly created account and a status code 201 (created).
 
     In case the form is not valid, the view returns a JSON response with the errors of the form and a 
-    status code 400 (incorrect request) in the form_invalid method.
+    status code 400 (incorrect request) in the form_invalid method. New accounts must be opened with a 
+    positive balance; the model itself only forbids negative balances.
     """
     model = Account
     fields = '__all__'
 
+    def get_form(self, form_class=None):
+        form = super().get_form(form_class)
+        form.fields['balance'].validators.append(
+            MinValueValidator(Decimal('0.01')))
+        return form
+
     def form_valid(self, form):
         self.object = form.save()
         data = {
@@ -55,7 +61,10 @@ class AccountUpdateView(UpdateView):
     fields = '__all__'
 
     def form_valid(self, form):
-        self.object = form.save()
+        # Only write the columns that were edited instead of the whole row.
+        self.object = form.save(commit=False)
+        if form.changed_data:
+            self.object.save(update_fields=[*form.changed_data, 'last_update'])
         data = {
             'id': self.object.id,
             'account_number': self.object.account_number,
@@ -73,22 +82,19 @@ class AccountUpdateView(UpdateView):
 
 class AccountDeleteView(DeleteView):
     """
-    Is responsible for deleting a specific bank account. Receive a POST request and use the 
-    get_object method to obtain the corresponding account object through the account number 
-    provided in the URL arguments. If the account is found, a JSON response is deleted and 
-    returned with a message indicating that the deletion has been successful and an HTTP 200 status code.
+    Is responsible for deleting a specific bank account. Receive a POST request and delete the account 
+    with the account number provided in the URL arguments through a queryset delete; the account row is 
+    still read to cascade the deletion to its transactions. If the account is found, it is deleted and a 
+    JSON response is returned with a message indicating that the deletion has been successful and an 
+    HTTP 200 status code; otherwise a 404 error is returned.
     """
     model = Account
 
-    def get_object(self, queryset=None):
-        queryset = self.get_queryset()
-        obj = get_object_or_404(
-            queryset, account_number=self.kwargs['account_number'])
-        return obj
-
     def post(self, request, *args, **kwargs):
-        self.object = self.get_object()
-        self.object.delete()
+        deleted, _ = Account.objects.filter(
+            account_number=self.kwargs['account_number']).delete()
+        if not deleted:
+            raise Http404("Account Does Not Exist")
         data = {'message': 'Object deleted successfully.'}
         return JsonResponse(data, status=200)
 
@@ -110,7 +116,7 @@ class AccountDetailView(DetailView):
         return obj
 
     def render_to_response(self, context, **response_kwargs):
-        obj = self.get_object()
+        obj = context['object']
         data = {
             "account_number": obj.account_number,
             "balance": obj.balance,
@@ -137,7 +143,7 @@ class TransactionCreateView(CreateView):
         self.object = form.save()
         data = {
             'transaction_id': self.object.transaction_id,
-            'account_number': self.object.account_number.id,
+            'account_number': self.object.account_number_id,
             'amount': self.object.amount,
             'transaction_type': self.object.transaction_type,
             'timestamp': self.object.timestamp,
@@ -164,10 +170,13 @@ class TransactionUpdateView(UpdateView):
     fields = '__all__'
 
     def form_valid(self, form):
-        self.object = form.save()
+        # Only write the columns that were edited instead of the whole row.
+        self.object = form.save(commit=False)
+        if form.changed_data:
+            self.object.save(update_fields=form.changed_data)
         data = {
             'transaction_id': self.object.transaction_id,
-            'account_number': self.object.account_number.id,
+            'account_number': self.object.account_number_id,
             'amount': self.object.amount,
             'transaction_type': self.object.transaction_type,
             'description': self.object.description,
@@ -186,22 +195,18 @@ class TransactionDeleteView(DeleteView):
     Is responsible for handling requests to delete objects from the database. 
     In particular, it is designed to handle requests to remove objects of type Transaction.
 
-    To do this, the view implements a get_object() method that obtains the transaction object 
-    corresponding to the current deletion request. Then, in the post() method, the object is deleted 
-    and a JsonResponse object is returned that indicates that the operation has been performed correctly, 
-    along with a 200 status code.
+    To do this, the post() method deletes the transaction matching the transaction_id of the URL with a 
+    single DELETE, without loading it first, and a JsonResponse object is returned that indicates that the 
+    operation has been performed correctly, along with a 200 status code. If no transaction matches, a 
+    404 error is returned.
     """
     model = Transaction
 
-    def get_object(self, queryset=None):
-        queryset = self.get_queryset()
-        obj = get_object_or_404(
-            queryset, transaction_id=self.kwargs['transaction_id'])
-        return obj
-
     def post(self, request, *args, **kwargs):
-        self.object = self.get_object()
-        self.object.delete()
+        deleted, _ = Transaction.objects.filter(
+            transaction_id=self.kwargs['transaction_id']).delete()
+        if not deleted:
+            raise Http404("Transaction Does Not Exist")
         data = {'message': 'Object deleted successfully.'}
         return JsonResponse(data, status=200)
 
@@ -209,13 +214,19 @@ class TransactionDeleteView(DeleteView):
 class TransactionDetailView(DetailView):
     """
     Shows detailed information about a transaction using the Transaction model. 
-    First, the object from the transaction is retrieved and serialized into a custom JSON object using 
-    a custom encoder that handles objects of type Account. Then, the JSON object is returned in response 
-    to the request in secure format. If the JSON object cannot be serialized, an appropriate error message 
-    is returned.
+    First, the object from the transaction is retrieved and its fields are collected in a dictionary, 
+    with the account reduced to its account number. Then, the dictionary is returned in response 
+    to the request as a JSON object.
     """
     model = Transaction
 
+    def get_queryset(self):
+        # The response includes the account, fetch it in the same query and
+        # load only the serialized columns.
+        return Transaction.objects.select_related('account_number').only(
+            'transaction_id', 'amount', 'transaction_type', 'description',
+            'status', 'account_number__account_number')
+
     def get_object(self, queryset=None):
         queryset = self.get_queryset()
         obj = get_object_or_404(
@@ -223,23 +234,16 @@ class TransactionDetailView(DetailView):
         return obj
 
     def render_to_response(self, context, **response_kwargs):
-        def custom_encoder(o):
-            if isinstance(o, Account):
-                return {'account_number': o.account_number}
-            raise TypeError(
-                f'Object of type {o.__class__.__name__} is not JSON serializable')
-        obj = self.get_object()
+        obj = context['object']
         data = {
             "transaction_id": obj.transaction_id,
-            "account_number": obj.account_number,
+            "account_number": {'account_number': obj.account_number.account_number},
             "amount": obj.amount,
             "transaction_type": obj.transaction_type,
             "description": obj.description,
             "status": obj.status,
         }
-        json_data = json.dumps(
-            data, cls=DjangoJSONEncoder, default=custom_encoder)
-        return JsonResponse(json_data, status=200, safe=False)
+        return JsonResponse(data, status=200)
 
 
 class TransactionListView(ListView):
@@ -251,18 +255,25 @@ class TransactionListView(ListView):
     If the bank account does not exist, the view returns a 404 response using the Http404 exception.
 
     The get method creates a list of transaction dictionaries and returns the response as a JSON object using 
-    the JsonResponse method. The safe=False argument is used to allow complex objects to be serialized, 
-    while json_dumps_params is used to add indentation and formatting to the returned JSON object for better 
-    readability.
+    the JsonResponse method. The safe=False argument is used to allow complex objects to be serialized. 
+    The list is written compactly, without indentation, since it is the largest response of the API.
     """
     model = Transaction
 
     def get_queryset(self):
         account_number = self.kwargs['account_number']
-        if not Account.objects.filter(account_number=account_number):
+        if not Account.objects.filter(account_number=account_number).exists():
             raise Http404("Account Does Not Exist")
-        queryset = Transaction.objects.filter(
-            account_number__account_number=account_number)
+        # Join the account and load only the serialized columns so the
+        # list costs one query no matter how many transactions it holds.
+        queryset = (
+            Transaction.objects
+            .filter(account_number__account_number=account_number)
+            .select_related('account_number')
+            .only('transaction_id', 'amount', 'transaction_type', 'timestamp',
+                  'description', 'status', 'account_number__account_number')
+            .order_by('timestamp', 'pk')
+        )
         return queryset
 
     def get(self, request, *args, **kwargs):
@@ -278,7 +289,7 @@ class TransactionListView(ListView):
                 "description": transaction.description,
                 "status": transaction.status,
             })
-        return JsonResponse(data, safe=False, json_dumps_params={'indent': 3})
+        return JsonResponse(data, safe=False)
 
 
 class AccountUpdateBalanceView(UpdateView):
@@ -288,14 +299,33 @@ class AccountUpdateBalanceView(UpdateView):
      form_valid y form_invalid. Si el formulario es válido, el método form_valid guarda el objeto 
      actualizado y devuelve un JsonResponse con los nuevos datos. Si el formulario no es válido, 
      el método form_invalid devuelve un JsonResponse con los errores de validación.
+
+     La cuenta no se lee antes de escribirla: el nuevo saldo se valida con el formulario y se guarda 
+     con un único UPDATE. Si ninguna cuenta tiene esa clave se devuelve un 404, también cuando el 
+     saldo enviado no es válido; solo en ese caso se consulta si la cuenta existe.
     """
     model = Account
     fields = ['balance']
 
+    def post(self, request, *args, **kwargs):
+        # Only the balance is validated, so an unsaved instance with the target
+        # pk stands in for the row instead of loading it.
+        self.object = Account(pk=self.kwargs['pk'])
+        form = self.get_form()
+        if form.is_valid():
+            return self.form_valid(form)
+        if not Account.objects.filter(pk=self.kwargs['pk']).exists():
+            raise Http404("Account Does Not Exist")
+        return self.form_invalid(form)
+
     def form_valid(self, form):
-        self.object = form.save()
+        balance = form.cleaned_data['balance']
+        updated = Account.objects.filter(pk=self.kwargs['pk']).update(
+            balance=balance, last_update=Now())
+        if not updated:
+            raise Http404("Account Does Not Exist")
         data = {
-            'balance': self.object.balance,
+            'balance': balance,
         }
 
         return JsonResponse(data, status=200)
@@ -6,6 +6,9 @@ import sys
 
 def main():
     """Run administrative tasks."""
+    if sys.argv[1:2] == ['test']:
+        # In-memory database, schema built from the models.
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'BackEnd_Challenge.test_settings')
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'BackEnd_Challenge.settings')
     try:
         from django.core.management import execute_from_command_line